@@ -5,6 +5,7 @@ from uuid import UUID
 
 from methodtools import lru_cache
 
+from inscripta.biocantor.constants import gencode
 from inscripta.biocantor.exc import (
     InvalidCDSIntervalError,
     NoSuchAncestorException,
@@ -36,6 +37,7 @@ class CDSInterval(AbstractFeatureInterval):
 
     frames = []
     _identifiers = ["protein_id", "product"]
+    _guid_in_dict = False
 
     def __init__(
         self,
@@ -106,9 +108,6 @@ class CDSInterval(AbstractFeatureInterval):
     def __repr__(self):
         return "<{}>".format(str(self))
 
-    def __len__(self):
-        return sum((end - start) for end, start in zip(self._genomic_ends, self._genomic_starts))
-
     @property
     def id(self) -> str:
         return self.protein_id
@@ -824,20 +823,33 @@ class CDSInterval(AbstractFeatureInterval):
             Codon is untranslatable and allow_unknown_translation is False
         """
         seq = str(self.extract_sequence()).upper()
-        translated_seq = []
-        for i in range(0, len(seq), 3):
-            codon_str = seq[i : i + 3]
-
-            codon = Codon(codon_str)
-            if i == 0 and codon.is_start_codon_in_specific_translation_table(translation_table):
-                translated_seq.append(Codon("ATG").translate())
-            else:
-                if strict and not codon.is_strict_codon:
-                    raise ValueError(f"Codon is not a strict codon: '{codon}'")
-                translated_seq.append(codon.translate(strict=strict))
+        codons = [seq[i : i + 3] for i in range(0, len(seq), 3)]
+        # look up every codon in the strict translation table; this covers the common case in one pass
+        translated_seq = list(map(gencode.get, codons))
+        if None not in translated_seq:
+            if codons and Codon(codons[0]).is_start_codon_in_specific_translation_table(translation_table):
+                translated_seq[0] = Codon("ATG").translate()
+            if truncate_at_in_frame_stop:
+                # stop after the first in-frame stop codon, unless it is the final codon
+                first_stop = "".join(translated_seq).find("*")
+                if 0 <= first_stop < len(translated_seq) - 1:
+                    del translated_seq[first_stop + 1 :]
+        else:
+            # partial, extended or invalid codons are translated one at a time, raising on the first bad codon
+            translated_seq = []
+            for i in range(0, len(seq), 3):
+                codon_str = seq[i : i + 3]
+
+                codon = Codon(codon_str)
+                if i == 0 and codon.is_start_codon_in_specific_translation_table(translation_table):
+                    translated_seq.append(Codon("ATG").translate())
+                else:
+                    if strict and not codon.is_strict_codon:
+                        raise ValueError(f"Codon is not a strict codon: '{codon}'")
+                    translated_seq.append(codon.translate(strict=strict))
 
-            if truncate_at_in_frame_stop and codon.is_stop_codon and i != len(seq) - 3:
-                break
+                if truncate_at_in_frame_stop and codon.is_stop_codon and i != len(seq) - 3:
+                    break
         alphabet = Alphabet.AA if strict else Alphabet.AA_STRICT_UNKNOWN
         return Sequence("".join(translated_seq), alphabet, validate_alphabet=False)
 
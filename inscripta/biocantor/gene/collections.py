@@ -13,7 +13,8 @@ such as promoters or transcription factor binding sites.
 Each object is capable of exporting itself to BED and GFF3.
 """
 import itertools
-from typing import List, Any, Dict, Set, Hashable, Optional, Union, Iterator, Tuple
+from operator import attrgetter
+from typing import List, Any, Dict, Set, FrozenSet, Hashable, Optional, Union, Iterator, Tuple
 from uuid import UUID
 
 from methodtools import lru_cache
@@ -28,11 +29,12 @@ from inscripta.biocantor.gene.interval import QualifierValue, IntervalType, Abst
 from inscripta.biocantor.gene.transcript import TranscriptInterval
 from inscripta.biocantor.gene.variants import VariantIntervalCollection, VariantInterval
 from inscripta.biocantor.io.gff3.rows import GFFRow
-from inscripta.biocantor.location import SingleInterval, EmptyLocation, Strand
+from inscripta.biocantor.location import EmptyLocation, Strand
 from inscripta.biocantor.parent import Parent, SequenceType
 from inscripta.biocantor.sequence import Alphabet
-from inscripta.biocantor.util.bins import bins
+from inscripta.biocantor.util.bins import bins, MAX_CHROM_SIZE
 from inscripta.biocantor.util.hashing import digest_object
+from inscripta.biocantor.util.interval_index import IntervalIndex
 
 try:
     import cgranges
@@ -41,6 +43,9 @@ except ImportError:
 else:
     HAS_CGRANGES = True
 
+# collections smaller than this do not build an IntervalIndex for position queries when cgranges is not installed
+POSITION_INDEX_MIN_SIZE = 64
+
 
 class AnnotationCollection(AbstractFeatureIntervalCollection):
     """An AnnotationCollection is a container to contain :class:`GeneInterval`,
@@ -77,6 +82,7 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
     """
 
     _identifiers = ["name"]
+    _guid_in_dict = False
 
     def __init__(
         self,
@@ -131,8 +137,9 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
             # if we have children, and the above did not work, then use the children
             # cannot infer a range for an empty collection
             if start is None and not self.is_empty:
-                start = min(f.start for f in self.iter_children())
-                end = max(f.end for f in self.iter_children())
+                # children are sorted by start position
+                start = self.children[0].start
+                end = max(map(attrgetter("end"), self.children))
 
         if start is None and end is None:
             # if we still have nothing, we are empty
@@ -146,17 +153,13 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         self.completely_within = completely_within
 
         self.guid_map: Dict[UUID, Union[GeneInterval, FeatureIntervalCollection, VariantIntervalCollection]] = {
-            x.guid: x for x in self.iter_children()
+            x.guid: x for x in self.children
         }
 
-        self.guid: UUID = digest_object(
-            self._location, self.name, self.sequence_name, self.qualifiers, self.completely_within, self.children_guids
-        )
-
         self._associate_intervals_with_variant_intervals()
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({','.join(str(f) for f in self.iter_children())})"
+        return f"{self.__class__.__name__}({self._children_repr(self.children)})"
 
     def __len__(self):
         return len(self.feature_collections) + len(self.genes)
@@ -203,13 +206,17 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         self.alternative_haplotype_mapping = {}
 
         if HAS_CGRANGES is False:
-            for variant_collection in self.variant_collections:
-                for gene_or_feature in itertools.chain(self.genes, self.feature_collections):
-                    if gene_or_feature.chunk_relative_location.has_overlap(variant_collection.chunk_relative_location):
-                        new_gene_or_feature = gene_or_feature.incorporate_variants(variant_collection)
-                        if variant_collection.guid not in self.alternative_haplotype_mapping:
-                            self.alternative_haplotype_mapping[variant_collection.guid] = []
-                        self.alternative_haplotype_mapping[variant_collection.guid].append(new_gene_or_feature)
+            index = IntervalIndex(
+                [variant_collection.genomic_start for variant_collection in self.variant_collections],
+                [variant_collection.genomic_end for variant_collection in self.variant_collections],
+            )
+            for gene_or_feature in itertools.chain(self.genes, self.feature_collections):
+                for variant_collection_idx in index.overlap(gene_or_feature.genomic_start, gene_or_feature.genomic_end):
+                    variant_collection = self.variant_collections[variant_collection_idx]
+                    new_gene_or_feature = gene_or_feature.incorporate_variants(variant_collection)
+                    if variant_collection.guid not in self.alternative_haplotype_mapping:
+                        self.alternative_haplotype_mapping[variant_collection.guid] = []
+                    self.alternative_haplotype_mapping[variant_collection.guid].append(new_gene_or_feature)
         else:
             tree = cgranges.cgranges()
             for i, variant_collection in enumerate(self.variant_collections):
@@ -235,9 +242,22 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         """Is this an empty collection?"""
         return len(self) == 0
 
+    @lru_cache(maxsize=1)
     @property
-    def children_guids(self) -> set:
-        return {x.guid for x in self.iter_children()}
+    def guid(self) -> UUID:
+        """
+        GUID of this collection, which is a digest of its location, metadata and the GUIDs of its children.
+        Computed on first access, because collections built by queries are often discarded without using it. Cached.
+        """
+        return digest_object(
+            self._location, self.name, self.sequence_name, self.qualifiers, self.completely_within, self.children_guids
+        )
+
+    @lru_cache(maxsize=1)
+    @property
+    def children_guids(self) -> FrozenSet[UUID]:
+        """GUIDs of all children. Cached."""
+        return frozenset(x.guid for x in self.iter_children())
 
     @lru_cache(maxsize=1)
     @property
@@ -293,7 +313,7 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         Sorted list of all children. Cached.
         """
         chain_iter = itertools.chain(self.genes, self.feature_collections, self.variant_collections)
-        return sorted(chain_iter, key=lambda x: x.start)
+        return sorted(chain_iter, key=attrgetter("start"))
 
     @lru_cache(maxsize=1)
     @property
@@ -302,15 +322,15 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         Sorted list of all non-variant children. Cached.
         """
         chain_iter = itertools.chain(self.genes, self.feature_collections)
-        return sorted(chain_iter, key=lambda x: x.start)
+        return sorted(chain_iter, key=attrgetter("start"))
 
     def iter_children(self) -> Iterator[Union[GeneInterval, FeatureIntervalCollection, VariantIntervalCollection]]:
         """Iterate over all intervals in this collection, in sorted order."""
-        yield from self.children
+        return iter(self.children)
 
     def iter_non_variant_children(self) -> Iterator[Union[GeneInterval, FeatureIntervalCollection]]:
         """Iterate over all intervals in this collection, in sorted order."""
-        yield from self.non_variant_children
+        return iter(self.non_variant_children)
 
     def to_dict(self, chromosome_relative_coordinates: bool = True, export_parent: bool = False) -> Dict[str, Any]:
         """Convert to a dict usable by :class:`~biocantor.io.models.AnnotationCollectionModel`.
@@ -598,7 +618,7 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
             end: Genome relative end position. If not set, will be unbounded.
             coding_only: Filter for coding genes only?
             completely_within: Strict *query* boundaries? If ``False``, features that partially overlap
-                will be included in the output. Bins optimization cannot be used, so these queries are slower.
+                will be included in the output.
             expand_location_to_children: Should the underlying location objects be expanded so that no
                 child gene/transcripts get sliced? If this is ``False``, then the constituent objects may not
                 actually represent their full lengths, although the original position information is retained.
@@ -635,6 +655,12 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
                 features_collections_to_keep,
                 variant_collections_to_keep,
             ) = self._optimized_query_by_position(start, end, completely_within, coding_only)
+        elif len(self.children) >= POSITION_INDEX_MIN_SIZE:
+            (
+                genes_to_keep,
+                features_collections_to_keep,
+                variant_collections_to_keep,
+            ) = self._indexed_query_by_position(start, end, completely_within, coding_only)
         else:
             genes_to_keep, features_collections_to_keep, variant_collections_to_keep = self._query_by_position(
                 start, end, completely_within, coding_only
@@ -683,75 +709,127 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         if not HAS_CGRANGES:
             raise RuntimeError("Cannot use this query mode without cgranges")
         tree = self._build_position_interval_tree()
+        child_starts, child_ends = self._child_coordinates
+        child_is_coding = self._child_is_coding
 
-        # cgranges only does .overlap() so need to restrict search when completely_within is True
-        if completely_within is True:
-            query_loc = SingleInterval(start, end, Strand.PLUS, parent=self.chromosome_location.parent)
-            coordinate_fn = query_loc.contains
-
-        genes_to_keep = []
-        features_collections_to_keep = []
-        variant_collections_to_keep = []
+        children_to_keep = []
         for _, __, result_idx in tree.overlap("", start, end):
-            child = self.children[result_idx]
-            # if completely_within is true, need to restrict further
-            if completely_within is True and not coordinate_fn(
-                child.chromosome_location, match_strand=False, full_span=True, strict_parent_compare=True
-            ):
+            # cgranges only does .overlap() so need to restrict search when completely_within is True
+            if completely_within is True and (child_starts[result_idx] < start or child_ends[result_idx] > end):
                 continue
-            elif coding_only is True and child.is_coding is False:
+            elif coding_only is True and not child_is_coding[result_idx]:
                 continue
-            if child.interval_type == IntervalType.FEATURE:
-                features_collections_to_keep.append(child)
-            elif child.interval_type == IntervalType.TRANSCRIPT:
-                genes_to_keep.append(child)
-            else:
-                variant_collections_to_keep.append(child)
-        return genes_to_keep, features_collections_to_keep, variant_collections_to_keep
+            children_to_keep.append(self.children[result_idx])
+        return self._partition_by_interval_type(children_to_keep)
+
+    @lru_cache(maxsize=1)
+    @property
+    def _child_coordinates(self) -> Tuple[List[int], List[int]]:
+        """
+        Genomic start and end positions of every child, in the same order as ``children``. Cached.
+        """
+        return [child.genomic_start for child in self.children], [child.genomic_end for child in self.children]
+
+    @lru_cache(maxsize=1)
+    @property
+    def _child_is_coding(self) -> List[bool]:
+        """
+        Whether every child is coding, in the same order as ``children``. Variant collections are never coding.
+        Cached.
+        """
+        return [child.interval_type != IntervalType.VARIANT and child.is_coding for child in self.children]
+
+    @lru_cache(maxsize=1)
+    def _build_position_interval_index(self) -> IntervalIndex:
+        """
+        Build a pure python position index of every child interval.
+        """
+        return IntervalIndex(*self._child_coordinates)
+
+    def _indexed_query_by_position(
+        self, start: int, end: int, completely_within: bool, coding_only: bool
+    ) -> Tuple[List[GeneInterval], List[FeatureIntervalCollection], List[VariantIntervalCollection]]:
+        """
+        Indexed implementation of position query. Used when `cgranges` is not installed, and this collection
+        has at least ``POSITION_INDEX_MIN_SIZE`` children. The index is cached if this is the first time it is
+        being built.
+        """
+        index = self._build_position_interval_index()
+        child_starts, child_ends = self._child_coordinates
+        child_is_coding = self._child_is_coding
+
+        children_to_keep = []
+        for result_idx in index.overlap(start, end):
+            # the index only does .overlap() so need to restrict search when completely_within is True
+            if completely_within is True and (child_starts[result_idx] < start or child_ends[result_idx] > end):
+                continue
+            elif coding_only is True and not child_is_coding[result_idx]:
+                continue
+            children_to_keep.append(self.children[result_idx])
+        return self._partition_by_interval_type(children_to_keep)
+
+    @lru_cache(maxsize=1)
+    @property
+    def _bin_index(self) -> Dict[int, List[int]]:
+        """
+        Construct a dictionary mapping UCSC bins to the positions in ``children`` of every child assigned to that bin.
+        Cached.
+        """
+        bin_index = {}
+        for child_idx, (child_start, child_end) in enumerate(zip(*self._child_coordinates)):
+            bin_index.setdefault(bins(child_start, child_end, fmt="bed"), []).append(child_idx)
+        return bin_index
 
     def _query_by_position(
         self, start: int, end: int, completely_within: bool, coding_only: bool
     ) -> Tuple[List[GeneInterval], List[FeatureIntervalCollection], List[VariantIntervalCollection]]:
         """
-        Non-optimized implementation of position query. Used when `cgranges` is not installed.
+        Non-optimized implementation of position query. Used when `cgranges` is not installed, and this collection
+        is too small to benefit from building an index.
+
+        If ``completely_within`` is ``True``, every matching child must be assigned to one of the bins that overlap
+        the query, so only the children in those bins are examined. This is skipped if there are more query bins
+        than children.
         """
-        # bins are only valid if we have start, end and completely_within
-        if completely_within and start and end:
-            my_bins = bins(start, end, fmt="bed", one=False)
-        else:
-            my_bins = None
+        children = self.children
+        child_starts, child_ends = self._child_coordinates
+
+        child_indices = range(len(children))
+        if completely_within and start >= 0 and end < MAX_CHROM_SIZE:
+            query_bins = bins(start, end, fmt="bed", one=False)
+            if len(query_bins) < len(children):
+                bin_index = self._bin_index
+                child_indices = sorted(
+                    child_idx for query_bin in query_bins for child_idx in bin_index.get(query_bin, ())
+                )
 
-        # coordinate_fn will be applied when filtering specific transcripts/features
-        query_loc = SingleInterval(start, end, Strand.PLUS, parent=self.chromosome_location.parent)
-        if completely_within:
-            coordinate_fn = query_loc.contains
-        else:
-            coordinate_fn = query_loc.has_overlap
+        child_is_coding = self._child_is_coding
 
-        genes_to_keep = []
-        features_collections_to_keep = []
-        variant_collections_to_keep = []
-        for child in self.iter_children():
+        children_to_keep = []
+        for child_idx in child_indices:
 
-            if coding_only and not child.is_coding:
+            if coding_only and not child_is_coding[child_idx]:
                 continue
 
-            # my_bins only exists if completely_within, start and end
-            # if no children match these bins, skip
-            elif my_bins and not any(grandchild.bin in my_bins for grandchild in child):
+            # regardless of completely_within flag, first just look for overlaps on the gene/feature collection level
+            elif completely_within:
+                if child_starts[child_idx] < start or child_ends[child_idx] > end:
+                    continue
+            elif child_starts[child_idx] >= end or child_ends[child_idx] <= start:
                 continue
 
-            # regardless of completely_within flag, first just look for overlaps on the gene/feature collection level
-            elif coordinate_fn(
-                child.chromosome_location, match_strand=False, full_span=True, strict_parent_compare=True
-            ):
-                if child.interval_type == IntervalType.FEATURE:
-                    features_collections_to_keep.append(child)
-                elif child.interval_type == IntervalType.TRANSCRIPT:
-                    genes_to_keep.append(child)
-                else:
-                    variant_collections_to_keep.append(child)
-        return genes_to_keep, features_collections_to_keep, variant_collections_to_keep
+            children_to_keep.append(children[child_idx])
+        return self._partition_by_interval_type(children_to_keep)
+
+    @staticmethod
+    def _partition_by_interval_type(
+        children: List[Union[GeneInterval, FeatureIntervalCollection, VariantIntervalCollection]]
+    ) -> Tuple[List[GeneInterval], List[FeatureIntervalCollection], List[VariantIntervalCollection]]:
+        """Split a list of children into genes, feature collections and variant collections, preserving order."""
+        partitions = {IntervalType.TRANSCRIPT: [], IntervalType.FEATURE: [], IntervalType.VARIANT: []}
+        for child in children:
+            partitions[child.interval_type].append(child)
+        return partitions[IntervalType.TRANSCRIPT], partitions[IntervalType.FEATURE], partitions[IntervalType.VARIANT]
 
     def _return_collection_for_id_queries(
         self,
@@ -761,21 +839,10 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
     ) -> "AnnotationCollection":
         """Convenience function shared by all functions that query by identifiers or GUIDs."""
 
-        if genes_to_keep or features_collections_to_keep or variant_collections_to_keep:
-            start = min(
-                self.start,
-                min(
-                    x.start
-                    for x in itertools.chain(genes_to_keep, features_collections_to_keep, variant_collections_to_keep)
-                ),
-            )
-            end = max(
-                self.end,
-                max(
-                    x.end
-                    for x in itertools.chain(genes_to_keep, features_collections_to_keep, variant_collections_to_keep)
-                ),
-            )
+        children = list(itertools.chain(genes_to_keep, features_collections_to_keep, variant_collections_to_keep))
+        if children:
+            start = min(self.start, min(map(attrgetter("start"), children)))
+            end = max(self.end, max(map(attrgetter("end"), children)))
         else:
             start = self.start
             end = self.end
@@ -801,42 +868,44 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         else:
             ids = id_or_ids
 
-        genes_to_keep = []
-        features_collections_to_keep = []
-        variant_collections_to_keep = []
-        for i in ids:
-            child = self.guid_map.get(i)
-            if child is None:
+        guid_int_map = self._guid_int_map
+        children_to_keep = []
+        for guid in ids:
+            # maps are keyed by UUID.int; anything that is not a UUID cannot match a child
+            if not isinstance(guid, UUID):
                 continue
-            elif child.interval_type == IntervalType.FEATURE:
-                features_collections_to_keep.append(child)
-            elif child.interval_type == IntervalType.TRANSCRIPT:
-                genes_to_keep.append(child)
-            else:
-                variant_collections_to_keep.append(child)
+            child = guid_int_map.get(guid.int)
+            if child is not None:
+                children_to_keep.append(child)
+        return self._return_collection_for_id_queries(*self._partition_by_interval_type(children_to_keep))
 
-        return self._return_collection_for_id_queries(
-            genes_to_keep, features_collections_to_keep, variant_collections_to_keep
-        )
+    @lru_cache(maxsize=1)
+    @property
+    def _guid_int_map(self) -> Dict[int, Union[GeneInterval, FeatureIntervalCollection, VariantIntervalCollection]]:
+        """
+        Construct a dictionary mapping the integer value of every child GUID to the child. Integer keys hash and
+        compare in C, while ``UUID`` keys call back into Python on every probe. Cached.
+        """
+        return {guid.int: child for guid, child in self.guid_map.items()}
 
     @lru_cache(maxsize=1)
     @property
     def _child_interval_guid_map(
         self,
     ) -> Dict[
-        UUID,
+        int,
         Tuple[
             Union[GeneInterval, FeatureIntervalCollection, VariantIntervalCollection],
             Union[TranscriptInterval, FeatureInterval, VariantInterval],
         ],
     ]:
         """
-        Construct a dictionary mapping grandchildren (interval GUIDs) to the children themselves.
+        Construct a dictionary mapping grandchildren (the integer value of interval GUIDs) to the children themselves.
         """
         guid_map = {}
         for child in self.iter_children():
             for grandchild in child.iter_children():
-                guid_map[grandchild.guid] = (child, grandchild)
+                guid_map[grandchild.guid.int] = (child, grandchild)
         return guid_map
 
     def query_by_interval_guids(self, id_or_ids: Union[UUID, List[UUID]]) -> "AnnotationCollection":
@@ -856,23 +925,28 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         else:
             ids = id_or_ids
 
-        gene_guids_to_keep = set()
-        features_collection_guids_to_keep = set()
-        variant_collection_guids_to_keep = set()
+        child_guids_to_keep = {
+            IntervalType.TRANSCRIPT: set(),
+            IntervalType.FEATURE: set(),
+            IntervalType.VARIANT: set(),
+        }
+        child_interval_guid_map = self._child_interval_guid_map
         for guid in ids:
-            if guid not in self._child_interval_guid_map:
+            if not isinstance(guid, UUID):
                 continue
-            child, _ = self._child_interval_guid_map[guid]
-            if child.interval_type == IntervalType.FEATURE:
-                features_collection_guids_to_keep.add(child.guid)
-            elif child.interval_type == IntervalType.TRANSCRIPT:
-                gene_guids_to_keep.add(child.guid)
-            else:
-                variant_collection_guids_to_keep.add(child.guid)
-
-        genes_to_keep = [self.guid_map[x].query_by_guids(ids) for x in gene_guids_to_keep]
-        features_collections_to_keep = [self.guid_map[x].query_by_guids(ids) for x in features_collection_guids_to_keep]
-        variant_collections_to_keep = [self.guid_map[x].query_by_guids(ids) for x in variant_collection_guids_to_keep]
+            child_and_grandchild = child_interval_guid_map.get(guid.int)
+            if child_and_grandchild is None:
+                continue
+            child, _ = child_and_grandchild
+            child_guids_to_keep[child.interval_type].add(child.guid)
+
+        genes_to_keep = [self.guid_map[x].query_by_guids(ids) for x in child_guids_to_keep[IntervalType.TRANSCRIPT]]
+        features_collections_to_keep = [
+            self.guid_map[x].query_by_guids(ids) for x in child_guids_to_keep[IntervalType.FEATURE]
+        ]
+        variant_collections_to_keep = [
+            self.guid_map[x].query_by_guids(ids) for x in child_guids_to_keep[IntervalType.VARIANT]
+        ]
         return self._return_collection_for_id_queries(
             genes_to_keep, features_collections_to_keep, variant_collections_to_keep
         )
@@ -897,10 +971,14 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
             ids = id_or_ids
 
         gene_guids_to_keep = set()
+        child_interval_guid_map = self._child_interval_guid_map
         for guid in ids:
-            if guid not in self._child_interval_guid_map:
+            if not isinstance(guid, UUID):
                 continue
-            child, _ = self._child_interval_guid_map[guid]
+            child_and_grandchild = child_interval_guid_map.get(guid.int)
+            if child_and_grandchild is None:
+                continue
+            child, _ = child_and_grandchild
             if child.interval_type == IntervalType.TRANSCRIPT:
                 gene_guids_to_keep.add(child.guid)
 
@@ -927,16 +1005,33 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
             ids = id_or_ids
 
         features_collection_guids_to_keep = set()
+        child_interval_guid_map = self._child_interval_guid_map
         for guid in ids:
-            if guid not in self._child_interval_guid_map:
+            if not isinstance(guid, UUID):
+                continue
+            child_and_grandchild = child_interval_guid_map.get(guid.int)
+            if child_and_grandchild is None:
                 continue
-            child, _ = self._child_interval_guid_map[guid]
+            child, _ = child_and_grandchild
             if child.interval_type == IntervalType.FEATURE:
                 features_collection_guids_to_keep.add(child.guid)
 
         features_collections_to_keep = [self.guid_map[x].query_by_guids(ids) for x in features_collection_guids_to_keep]
         return self._return_collection_for_id_queries([], features_collections_to_keep, [])
 
+    @lru_cache(maxsize=1)
+    @property
+    def _identifier_index(self) -> Dict[Union[str, UUID], List[int]]:
+        """
+        Construct a dictionary mapping identifiers to the positions of every child in ``children`` that has
+        that identifier. Cached.
+        """
+        identifier_index = {}
+        for child_idx, child in enumerate(self.children):
+            for identifier in child.identifiers:
+                identifier_index.setdefault(identifier, []).append(child_idx)
+        return identifier_index
+
     def query_by_feature_identifiers(self, id_or_ids: Union[str, List[str]]) -> "AnnotationCollection":
         """Filter this annotation collection object by a list of identifiers, or a single identifier.
 
@@ -944,7 +1039,7 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         all matching intervals will be returned. These ambiguous results will be adjacent in the resulting collection,
         but are not grouped or signified in any way.
 
-        This method is ``O(n_ids * m_identifiers)``.
+        The identifier index is built on the first call, after which this method is ``O(n_ids + n_matches)``.
 
         Args:
             id_or_ids: List of identifiers, or a single identifier.
@@ -957,21 +1052,13 @@ class AnnotationCollection(AbstractFeatureIntervalCollection):
         else:
             ids = set(id_or_ids)
 
-        genes_to_keep = []
-        features_collections_to_keep = []
-        variant_collections_to_keep = []
-        for child in self.iter_children():
-            if ids & child.identifiers:
-                if child.interval_type == IntervalType.FEATURE:
-                    features_collections_to_keep.append(child)
-                elif child.interval_type == IntervalType.TRANSCRIPT:
-                    genes_to_keep.append(child)
-                else:
-                    variant_collections_to_keep.append(child)
+        identifier_index = self._identifier_index
+        # children may match more than one identifier, so de-duplicate and then restore sorted order
+        child_indices = {child_idx for i in ids for child_idx in identifier_index.get(i, ())}
 
-        return self._return_collection_for_id_queries(
-            genes_to_keep, features_collections_to_keep, variant_collections_to_keep
-        )
+        children = self.children
+        children_to_keep = [children[child_idx] for child_idx in sorted(child_indices)]
+        return self._return_collection_for_id_queries(*self._partition_by_interval_type(children_to_keep))
 
     def get_children_by_type(
         self, child_type: str
@@ -3,10 +3,12 @@ Object representation of features. Includes an abstract feature class that is al
 
 Each object is capable of exporting itself to BED and GFF3.
 """
-from functools import reduce
-from typing import Optional, Any, Dict, List, Set, Iterable, Iterator, Hashable, Union, TYPE_CHECKING
+from operator import attrgetter
+from typing import Optional, Any, Dict, List, Set, FrozenSet, Iterable, Iterator, Hashable, Union, TYPE_CHECKING
 from uuid import UUID
 
+from methodtools import lru_cache
+
 from inscripta.biocantor.exc import (
     EmptyLocationException,
     NoSuchAncestorException,
@@ -545,15 +547,17 @@ class FeatureIntervalCollection(AbstractFeatureIntervalCollection):
         # qualifiers come in as a List, convert to Set
         self._import_qualifiers_from_list(qualifiers)
         self.feature_collection_type = feature_collection_type
-        self.feature_types = set.union(*[x.feature_types for x in feature_intervals])
+        self.feature_types = set()
+        for feature_interval in feature_intervals:
+            self.feature_types.update(feature_interval.feature_types)
 
         if not self.feature_intervals:
             raise InvalidAnnotationError("FeatureCollection must have features")
 
         # start/end are assumed to be in genomic coordinates, and then _initialize_location
         # will transform them into chunk-relative coordinates if necessary
-        self.start = self.genomic_start = min(f.start for f in self.feature_intervals)
-        self.end = self.genomic_end = max(f.end for f in self.feature_intervals)
+        self.start = self.genomic_start = min(map(attrgetter("start"), self.feature_intervals))
+        self.end = self.genomic_end = max(map(attrgetter("end"), self.feature_intervals))
         self._initialize_location(self.start, self.end, parent_or_seq_chunk_parent)
         self.bin = bins(self.start, self.end, fmt="bed")
 
@@ -583,7 +587,7 @@ class FeatureIntervalCollection(AbstractFeatureIntervalCollection):
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(identifiers={self.identifiers}, "
-            f"Intervals:{','.join(str(f) for f in self.feature_intervals)})"
+            f"Intervals:{self._children_repr(self.feature_intervals)})"
         )
 
     def iter_children(self) -> Iterable[FeatureInterval]:
@@ -595,9 +599,19 @@ class FeatureIntervalCollection(AbstractFeatureIntervalCollection):
         """Never coding."""
         return False
 
+    @lru_cache(maxsize=1)
     @property
-    def children_guids(self) -> Set[UUID]:
-        return {x.guid for x in self.feature_intervals}
+    def children_guids(self) -> FrozenSet[UUID]:
+        """GUIDs of all children. Cached."""
+        return frozenset(x.guid for x in self.feature_intervals)
+
+    def _reset_parent(self, parent: Optional[Parent] = None) -> None:
+        """
+        Overrides :meth:`~biocantor.gene.interval.AbstractFeatureIntervalCollection._reset_parent()` in order to
+        also clear the cached merged feature, whose location is built from the old parent.
+        """
+        super()._reset_parent(parent)
+        self.get_merged_feature.cache_clear()
 
     @property
     def id(self) -> str:
@@ -619,15 +633,12 @@ class FeatureIntervalCollection(AbstractFeatureIntervalCollection):
         if self.get_primary_feature() is not None:
             return self.get_primary_feature().get_spliced_sequence()
 
+    @lru_cache(maxsize=1)
     def get_merged_feature(self) -> FeatureInterval:
-        """Generate a single :class:`~biocantor.gene.feature.FeatureInterval` that merges all intervals together."""
-        intervals = []
-        for tx in self.feature_intervals:
-            for i in tx.chromosome_location.blocks:
-                intervals.append(i)
-        merged = reduce(lambda x, y: x.union(y), intervals)
-        interval_starts = [x.start for x in merged.blocks]
-        interval_ends = [x.end for x in merged.blocks]
+        """Generate a single :class:`~biocantor.gene.feature.FeatureInterval` that merges all intervals together.
+        Cached."""
+        intervals = [i for feat in self.feature_intervals for i in feat.chromosome_location.blocks]
+        interval_starts, interval_ends = self._merge_blocks(intervals)
 
         return FeatureInterval(
             interval_starts=interval_starts,
@@ -677,9 +688,19 @@ class FeatureIntervalCollection(AbstractFeatureIntervalCollection):
             parent_or_seq_chunk_parent=parent_or_seq_chunk_parent,
         )
 
-    def export_qualifiers(self) -> Dict[Hashable, Set[str]]:
-        """Exports qualifiers for GFF3/GenBank export"""
-        qualifiers = self.qualifiers.copy()
+    def export_qualifiers(self) -> Dict[Hashable, FrozenSet[str]]:
+        """Exports qualifiers for GFF3/GenBank export.
+
+        Returns a new dictionary on every call, so callers may add or remove keys. The values are frozensets
+        shared with a cached export, which is built from :attr:`qualifiers` on the first call; changes made to
+        :attr:`qualifiers` after that point are not reflected.
+        """
+        return dict(self._export_qualifiers())
+
+    @lru_cache(maxsize=1)
+    def _export_qualifiers(self) -> Dict[Hashable, FrozenSet[str]]:
+        """Cached implementation of :meth:`export_qualifiers()`."""
+        qualifiers = {key: set(vals) for key, vals in self.qualifiers.items()}
         for key, val in [
             [BioCantorQualifiers.FEATURE_COLLECTION_ID.value, self.feature_collection_id],
             [BioCantorQualifiers.FEATURE_COLLECTION_NAME.value, self.feature_collection_name],
@@ -693,7 +714,7 @@ class FeatureIntervalCollection(AbstractFeatureIntervalCollection):
             qualifiers[key].add(val)
         if self.feature_types:
             qualifiers[BioCantorQualifiers.FEATURE_TYPE.value] = self.feature_types
-        return qualifiers
+        return {key: frozenset(vals) for key, vals in qualifiers.items()}
 
     def query_by_guids(self, id_or_ids: Union[UUID, List[UUID]]) -> Optional["FeatureIntervalCollection"]:
         """Filter this feature collection object by a list of unique IDs.
@@ -1,7 +1,9 @@
-from functools import reduce
-from typing import List, Optional, Dict, Hashable, Iterable, Iterator, Any, Union, Set, TYPE_CHECKING
+from operator import attrgetter
+from typing import List, Optional, Dict, Hashable, Iterable, Iterator, Any, Union, FrozenSet, TYPE_CHECKING
 from uuid import UUID
 
+from methodtools import lru_cache
+
 from inscripta.biocantor import SequenceType
 from inscripta.biocantor.exc import (
     InvalidAnnotationError,
@@ -16,7 +18,7 @@ from inscripta.biocantor.gene.interval import AbstractFeatureIntervalCollection,
 from inscripta.biocantor.io.gff3.constants import BioCantorQualifiers, GFF_SOURCE, BioCantorFeatureTypes, NULL_COLUMN
 from inscripta.biocantor.io.gff3.exc import GFF3MissingSequenceNameError
 from inscripta.biocantor.io.gff3.rows import GFFRow, GFFAttributes
-from inscripta.biocantor.location import Location
+from inscripta.biocantor.location import SingleInterval
 from inscripta.biocantor.parent import Parent
 from inscripta.biocantor.sequence import Sequence
 from inscripta.biocantor.util.bins import bins
@@ -73,11 +75,12 @@ class GeneInterval(AbstractFeatureIntervalCollection):
         # qualifiers come in as a List, convert to Set
         self._import_qualifiers_from_list(qualifiers)
         self.primary_transcript = AbstractFeatureIntervalCollection._find_primary_feature(self.transcripts)
+        self._is_coding = any(tx.is_coding for tx in self.transcripts)
 
         # start/end are assumed to be in genomic coordinates, and then _initialize_location
         # will transform them into chunk-relative coordinates if necessary
-        self.start = self.genomic_start = min(tx.start for tx in self.transcripts)
-        self.end = self.genomic_end = max(tx.end for tx in self.transcripts)
+        self.start = self.genomic_start = min(map(attrgetter("start"), self.transcripts))
+        self.end = self.genomic_end = max(map(attrgetter("end"), self.transcripts))
         self._initialize_location(self.start, self.end, parent_or_seq_chunk_parent)
         self.bin = bins(self.start, self.end, fmt="bed")
 
@@ -104,7 +107,7 @@ class GeneInterval(AbstractFeatureIntervalCollection):
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(identifiers={self.identifiers}, "
-            f"Intervals:{','.join(str(f) for f in self.transcripts)})"
+            f"Intervals:{self._children_repr(self.transcripts)})"
         )
 
     def iter_children(self) -> Iterable[TranscriptInterval]:
@@ -113,7 +116,7 @@ class GeneInterval(AbstractFeatureIntervalCollection):
     @property
     def is_coding(self) -> bool:
         """One or more coding isoforms?"""
-        return any(tx.is_coding for tx in self.transcripts)
+        return self._is_coding
 
     @property
     def id(self) -> str:
@@ -125,9 +128,20 @@ class GeneInterval(AbstractFeatureIntervalCollection):
         """Returns the name of this gene. Provides a shared API across genes/transcripts and features."""
         return self.gene_symbol
 
+    @lru_cache(maxsize=1)
     @property
-    def children_guids(self):
-        return {x.guid for x in self.transcripts}
+    def children_guids(self) -> FrozenSet[UUID]:
+        """GUIDs of all children. Cached."""
+        return frozenset(x.guid for x in self.transcripts)
+
+    def _reset_parent(self, parent: Optional[Parent] = None) -> None:
+        """
+        Overrides :meth:`~biocantor.gene.interval.AbstractFeatureIntervalCollection._reset_parent()` in order to
+        also clear the cached merged features, whose locations are built from the old parent.
+        """
+        super()._reset_parent(parent)
+        self.get_merged_transcript.cache_clear()
+        self.get_merged_cds.cache_clear()
 
     def to_dict(self, chromosome_relative_coordinates: bool = True) -> Dict[str, Any]:
         """Convert to a dict usable by :class:`~biocantor.io.models.GeneIntervalModel`."""
@@ -192,13 +206,11 @@ class GeneInterval(AbstractFeatureIntervalCollection):
         if self.get_primary_cds() is not None:
             return self.primary_transcript.get_protein_sequence()
 
-    def _produce_merged_feature(self, intervals: List[Location]) -> FeatureInterval:
+    def _produce_merged_feature(self, intervals: List[SingleInterval]) -> FeatureInterval:
         """Wrapper function used by both :func:`GeneInterval.get_merged_transcript`
         and :func:`GeneInterval.get_merged_cds`.
         """
-        merged = reduce(lambda x, y: x.union(y), intervals)
-        interval_starts = [x.start for x in merged.blocks]
-        interval_ends = [x.end for x in merged.blocks]
+        interval_starts, interval_ends = self._merge_blocks(intervals)
 
         return FeatureInterval(
             interval_starts=interval_starts,
@@ -221,31 +233,36 @@ class GeneInterval(AbstractFeatureIntervalCollection):
         """
         return self.get_merged_transcript()
 
+    @lru_cache(maxsize=1)
     def get_merged_transcript(self) -> FeatureInterval:
         """Generate a single :class:`~biocantor.gene.feature.FeatureInterval` that merges all child features together.
 
-        This inherently has no translation and so is returned as a generic feature, not a transcript.
+        This inherently has no translation and so is returned as a generic feature, not a transcript. Cached.
         """
-        intervals = []
-        for tx in self.transcripts:
-            for i in tx.chromosome_location.blocks:
-                intervals.append(i)
+        intervals = [i for tx in self.transcripts for i in tx.chromosome_location.blocks]
         return self._produce_merged_feature(intervals)
 
+    @lru_cache(maxsize=1)
     def get_merged_cds(self) -> FeatureInterval:
-        """Generate a single :class:`~biocantor.gene.feature.FeatureInterval` that merges all CDS intervals."""
-        intervals = []
-        for tx in self.transcripts:
-            if tx.is_coding:
-                for i in tx.cds.chromosome_location.blocks:
-                    intervals.append(i)
+        """Generate a single :class:`~biocantor.gene.feature.FeatureInterval` that merges all CDS intervals. Cached."""
+        intervals = [i for tx in self.transcripts if tx.is_coding for i in tx.cds.chromosome_location.blocks]
         if not intervals:
             raise NoncodingTranscriptError("No CDS transcripts found on this gene")
         return self._produce_merged_feature(intervals)
 
-    def export_qualifiers(self) -> Dict[Hashable, Set[str]]:
-        """Exports qualifiers for GFF3/GenBank export"""
-        qualifiers = self.qualifiers.copy()
+    def export_qualifiers(self) -> Dict[Hashable, FrozenSet[str]]:
+        """Exports qualifiers for GFF3/GenBank export.
+
+        Returns a new dictionary on every call, so callers may add or remove keys. The values are frozensets
+        shared with a cached export, which is built from :attr:`qualifiers` on the first call; changes made to
+        :attr:`qualifiers` after that point are not reflected.
+        """
+        return dict(self._export_qualifiers())
+
+    @lru_cache(maxsize=1)
+    def _export_qualifiers(self) -> Dict[Hashable, FrozenSet[str]]:
+        """Cached implementation of :meth:`export_qualifiers()`."""
+        qualifiers = {key: set(vals) for key, vals in self.qualifiers.items()}
         for key, val in [
             [BioCantorQualifiers.GENE_ID.value, self.gene_id],
             [BioCantorQualifiers.GENE_NAME.value, self.gene_symbol],
@@ -257,7 +274,7 @@ class GeneInterval(AbstractFeatureIntervalCollection):
             if key not in qualifiers:
                 qualifiers[key] = set()
             qualifiers[key].add(val)
-        return qualifiers
+        return {key: frozenset(vals) for key, vals in qualifiers.items()}
 
     def query_by_guids(self, id_or_ids: Union[UUID, List[UUID]]) -> Optional["GeneInterval"]:
         """Filter this gene interval object by a list of unique IDs.
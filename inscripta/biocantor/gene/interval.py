@@ -3,7 +3,22 @@ This module contains abstract base classes for interval types and interval colle
 """
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Union, Dict, Hashable, Set, Optional, Any, Iterable, Iterator, TypeVar, TYPE_CHECKING
+from operator import sub
+from typing import (
+    List,
+    Union,
+    Dict,
+    Hashable,
+    Set,
+    FrozenSet,
+    Optional,
+    Any,
+    Iterable,
+    Iterator,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
 from uuid import UUID
 
 from methodtools import lru_cache
@@ -11,7 +26,6 @@ from methodtools import lru_cache
 from inscripta.biocantor.exc import (
     ValidationException,
     NullSequenceException,
-    NullParentException,
     NoSuchAncestorException,
     LocationOverlapException,
 )
@@ -26,6 +40,9 @@ from inscripta.biocantor.util.object_validation import ObjectValidation
 # primitive data types possible as values of the list in a qualifiers dictionary
 QualifierValue = TypeVar("QualifierValue", str, int, bool, float)
 
+# maximum number of children included in the string representation of a collection
+REPR_MAX_CHILDREN = 3
+
 if TYPE_CHECKING:
     from inscripta.biocantor.gene.transcript import TranscriptInterval
     from inscripta.biocantor.gene.feature import FeatureInterval
@@ -60,6 +77,8 @@ class AbstractInterval(ABC):
     start: int
     end: int
     _parent_or_seq_chunk_parent: Optional[Parent] = None
+    # is the GUID part of the dictionary representation? If so, equality checks can compare GUIDs first
+    _guid_in_dict: bool = True
 
     def __len__(self):
         return self.end - self.start
@@ -67,6 +86,8 @@ class AbstractInterval(ABC):
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
+        elif self._guid_in_dict and self.guid != other.guid:
+            return False
         elif not self.to_dict() == other.to_dict():
             return False
         else:
@@ -192,14 +213,9 @@ class AbstractInterval(ABC):
     @property
     def has_sequence(self) -> bool:
         """Returns true if this Interval has an associated sequence of any type"""
-        try:
-            ObjectValidation.require_location_has_parent_with_sequence(self.chunk_relative_location)
-        except NullSequenceException:
-            return False
-        except NullParentException:
-            return False
-        else:
-            return True
+        # check directly rather than catching the validation exceptions, which format the location in their messages
+        parent = self.chunk_relative_location.parent
+        return bool(parent and parent.sequence)
 
     @property
     @abstractmethod
@@ -561,7 +577,7 @@ class AbstractFeatureInterval(AbstractInterval, ABC):
     _is_primary_feature: Optional[bool] = None
 
     def __len__(self):
-        return sum((end - start) for end, start in zip(self._genomic_ends, self._genomic_starts))
+        return sum(map(sub, self._genomic_ends, self._genomic_starts))
 
     @lru_cache(maxsize=1)
     @property
@@ -807,10 +823,10 @@ class AbstractFeatureIntervalCollection(AbstractInterval, ABC):
         """Iterate over the children"""
 
     @abstractmethod
-    def children_guids(self) -> Set[UUID]:
+    def children_guids(self) -> FrozenSet[UUID]:
         """Get all of the GUIDs for children.
 
-        Returns: A set of UUIDs
+        Returns: A frozenset of UUIDs
         """
 
     @abstractmethod
@@ -821,6 +837,79 @@ class AbstractFeatureIntervalCollection(AbstractInterval, ABC):
             id_or_ids: List of GUIDs, or unique IDs. Can also be a single ID.
         """
 
+    @staticmethod
+    def _children_repr(children: List[AbstractInterval]) -> str:
+        """
+        String representation of the children of a collection, for use in ``__repr__``. Only the first
+        ``REPR_MAX_CHILDREN`` children are included, followed by a count of the remaining children.
+        """
+        children_repr = ",".join(str(child) for child in children[:REPR_MAX_CHILDREN])
+        if len(children) > REPR_MAX_CHILDREN:
+            children_repr += f",...{len(children) - REPR_MAX_CHILDREN} more"
+        return children_repr
+
+    @staticmethod
+    def _merge_blocks(blocks: List[SingleInterval]) -> Tuple[List[int], List[int]]:
+        """Merge a list of blocks into sorted, non-overlapping block starts and ends.
+
+        This produces the same blocks as folding :meth:`~biocantor.location.location.Location.union()` over the
+        blocks in order, but operates on coordinate tuples instead of building a new location for every step.
+        Overlapping blocks are merged and empty blocks are discarded. Adjacent blocks are combined, except when
+        the fold joins two disjoint single intervals; ``union`` leaves such a pair of blocks separate.
+
+        Args:
+            blocks: List of blocks. Must all be on the same strand.
+
+        Returns:
+            A tuple of lists of block starts and block ends.
+
+        Raises:
+            ValueError: If the blocks are not all on the same strand.
+        """
+        strand = blocks[0].strand
+        for block in blocks:
+            if block.strand != strand:
+                raise ValueError(f"Strands do not match: {strand} != {block.strand}")
+
+        merged = [(blocks[0].start, blocks[0].end)]
+        for block in blocks[1:]:
+            start, end = block.start, block.end
+            if len(merged) == 1:
+                # union of two single intervals
+                merged_start, merged_end = merged[0]
+                if merged_end == merged_start:
+                    merged = [(start, end)]
+                elif end == start:
+                    continue
+                elif start < merged_end and merged_start < end:
+                    merged = [(min(start, merged_start), max(end, merged_end))]
+                else:
+                    merged = sorted([merged[0], (start, end)])
+                continue
+            # union of a compound interval with a single interval: absorb the overlapping blocks, then drop
+            # empty blocks and combine adjacent blocks
+            blocks_to_combine = []
+            if end > start:
+                new_start, new_end = start, end
+                for merged_start, merged_end in merged:
+                    if merged_start < end and start < merged_end:
+                        new_start = min(new_start, merged_start)
+                        new_end = max(new_end, merged_end)
+                    else:
+                        blocks_to_combine.append((merged_start, merged_end))
+                blocks_to_combine.append((new_start, new_end))
+                blocks_to_combine.sort()
+            else:
+                blocks_to_combine = merged
+            merged = [blocks_to_combine[0]]
+            for merged_start, merged_end in blocks_to_combine[1:]:
+                if merged[-1][1] == merged_start:
+                    merged[-1] = (merged[-1][0], merged_end)
+                else:
+                    merged.append((merged_start, merged_end))
+
+        return [start for start, _ in merged], [end for _, end in merged]
+
     def _reset_parent(self, parent: Optional[Parent] = None) -> None:
         """Reset parent of this collection, and all of its children.
 
@@ -879,22 +968,22 @@ class AbstractFeatureIntervalCollection(AbstractInterval, ABC):
         """
         # see if we were given a primary feature
         primary_feature = None
-        for i, interval in enumerate(intervals):
+        for interval in intervals:
             if interval.is_primary_feature:
                 if primary_feature:
                     raise ValidationException("Multiple primary features/transcripts found")
-                primary_feature = intervals[i]
+                primary_feature = interval
         # if no primary interval was given, then infer by longest CDS then longest interval
         # if this is a feature, then there is no CDS, so set that value to 0
+        # min() returns the first of any tied intervals, so position in the list breaks ties
         if primary_feature is None:
-            interval_sizes = sorted(
-                (
-                    [interval.cds_size if interval.interval_type == IntervalType.TRANSCRIPT else 0, len(interval), i]
-                    for i, interval in enumerate(intervals)
+            primary_feature = min(
+                intervals,
+                key=lambda interval: (
+                    -interval.cds_size if interval.interval_type == IntervalType.TRANSCRIPT else 0,
+                    -len(interval),
                 ),
-                key=lambda x: (-x[0], -x[1]),
             )
-            primary_feature = intervals[interval_sizes[0][2]]
         return primary_feature
 
     def _liftover_this_location_to_seq_chunk_parent(
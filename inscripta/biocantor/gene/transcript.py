@@ -166,9 +166,6 @@ class TranscriptInterval(AbstractFeatureInterval):
         """Is this the primary transcript?"""
         return self.is_primary_feature
 
-    def __len__(self):
-        return sum((end - start) for end, start in zip(self._genomic_ends, self._genomic_starts))
-
     @property
     def cds_location(self) -> Location:
         """Returns the Location of the CDS in *chromosome coordinates*"""
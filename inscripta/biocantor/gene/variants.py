@@ -42,9 +42,12 @@ A deletion from 13 to 15 without padding:
     deletion_13_15 = VariantInterval(start=13, end=15, sequence="", variant_type="deletion")
 
 """
-from typing import Optional, Dict, Hashable, Any, Iterable, Iterator, Set, List, Union
+from operator import attrgetter
+from typing import Optional, Dict, Hashable, Any, Iterable, Iterator, Set, FrozenSet, List, Union
 from uuid import UUID
 
+from methodtools import lru_cache
+
 from inscripta.biocantor.exc import (
     DuplicateFeatureError,
     LocationOverlapException,
@@ -362,8 +365,8 @@ class VariantIntervalCollection(AbstractFeatureIntervalCollection):
         self.sequence_guid = sequence_guid
         # qualifiers come in as a List, convert to Set
         self._import_qualifiers_from_list(qualifiers)
-        self.start = self.genomic_start = min(f.start for f in self.variant_intervals)
-        self.end = self.genomic_end = max(f.end for f in self.variant_intervals)
+        self.start = self.genomic_start = min(map(attrgetter("start"), self.variant_intervals))
+        self.end = self.genomic_end = max(map(attrgetter("end"), self.variant_intervals))
         self._initialize_location(self.start, self.end, parent_or_seq_chunk_parent)
         self.variant_types = {x.variant_type for x in self.variant_intervals}
         self._parent_or_seq_chunk_parent = parent_or_seq_chunk_parent
@@ -393,15 +396,17 @@ class VariantIntervalCollection(AbstractFeatureIntervalCollection):
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(identifiers={self.identifiers}, "
-            f"Intervals:{','.join(str(f) for f in self.variant_intervals)})"
+            f"Intervals:{self._children_repr(self.variant_intervals)})"
         )
 
     def iter_children(self) -> Iterable["AbstractInterval"]:
         yield from self.variant_intervals
 
+    @lru_cache(maxsize=1)
     @property
-    def children_guids(self) -> Set[UUID]:
-        return {x.guid for x in self.variant_intervals}
+    def children_guids(self) -> FrozenSet[UUID]:
+        """GUIDs of all children. Cached."""
+        return frozenset(x.guid for x in self.variant_intervals)
 
     def query_by_guids(self, id_or_ids: Union[UUID, List[UUID]]) -> "VariantIntervalCollection":
         if isinstance(id_or_ids, UUID):
@@ -51,14 +51,8 @@ class FeatureIntervalIDQualifiers(IntEnum):
 
 
 FEATURE_INTERVAL_NAME_QUALIFIERS = {"feature_name", "name", "standard_name", "gene", "gene_name", "label", "operon"}
-FEATURE_INTERVAL_NAME_QUALIFIERS_REGEX = re.compile(
-    r"({})".format("|".join(f"^{k}$" for k in FEATURE_INTERVAL_NAME_QUALIFIERS)), re.IGNORECASE
-)
 
 FEATURE_INTERVAL_ID_QUALIFIERS = {"feature_id", "id"}
-FEATURE_INTERVAL_ID_QUALIFIERS_REGEX = re.compile(
-    r"({})".format("|".join(f"^{k}$" for k in FEATURE_INTERVAL_ID_QUALIFIERS)), re.IGNORECASE
-)
 
 
 # FEATURE_TYPE_IDENTIFIERS are case-insensitive substrings to match for identifying feature types to include.
@@ -77,7 +71,7 @@ def extract_feature_types(feature_types: Set[str], feature_qualifiers: Dict[str,
         feature_qualifiers: Qualifiers associated with a record from a genbank parsing event.
     """
     for key, vals in feature_qualifiers.items():
-        if re.search(FEATURE_TYPE_IDENTIFIERS_REGEX, key):
+        if FEATURE_TYPE_IDENTIFIERS_REGEX.search(key):
             feature_types.update(vals)
 
 
@@ -100,12 +94,13 @@ def extract_feature_name_id(feature_qualifiers: Dict[str, List[str]]) -> Tuple[s
     feature_id_key = None
     for qualifier, vals in feature_qualifiers.items():
         # exact case insensitive match
-        if re.match(FEATURE_INTERVAL_NAME_QUALIFIERS_REGEX, qualifier):
+        lowered_qualifier = qualifier.lower()
+        if lowered_qualifier in FEATURE_INTERVAL_NAME_QUALIFIERS:
             this_feature_key = FeatureIntervalNameQualifiers[qualifier.upper()]
             if not feature_key or this_feature_key < feature_key:
                 feature_name = vals[0]
                 feature_key = this_feature_key
-        elif re.match(FEATURE_INTERVAL_ID_QUALIFIERS_REGEX, qualifier):
+        elif lowered_qualifier in FEATURE_INTERVAL_ID_QUALIFIERS:
             this_feature_id_key = FeatureIntervalIDQualifiers[qualifier.upper()]
             if not feature_id_key or this_feature_id_key < feature_id_key:
                 feature_id = vals[0]
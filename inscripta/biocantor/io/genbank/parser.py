@@ -27,7 +27,7 @@ from abc import ABC, abstractmethod
 from collections import Counter
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Optional, TextIO, Iterator, List, Dict, Callable, Any, Union
+from typing import Optional, TextIO, Iterator, List, Dict, Callable, Any, Union, Type
 
 from Bio import SeqIO
 from Bio.SeqFeature import SeqFeature
@@ -84,7 +84,7 @@ from inscripta.biocantor.location import (
 class Feature(ABC):
     """Generic feature."""
 
-    types = set()
+    types = frozenset()
 
     def __init__(self, feature: SeqFeature, record: SeqRecord):
         if feature.type not in self.types:
@@ -221,7 +221,7 @@ class FeatureIntervalGenBankCollection:
 class GeneFeature(Feature):
     """A gene."""
 
-    types = {x.value for x in GeneFeatures}
+    types = frozenset(x.value for x in GeneFeatures)
 
     def __init__(self, feature: SeqFeature, record: SeqRecord):
         super().__init__(feature, record)
@@ -360,7 +360,7 @@ class GeneFeature(Feature):
 class TranscriptFeature(Feature):
     """A transcript"""
 
-    types = {x.value for x in TranscriptFeatures}
+    types = frozenset(x.value for x in TranscriptFeatures)
     _exon_interval = None
     _cds_interval = None
 
@@ -477,12 +477,21 @@ class TranscriptFeature(Feature):
 class CDSFeature(Feature):
     """A CDS interval"""
 
-    types = {GeneIntervalFeatures.CDS.value}
+    types = frozenset([GeneIntervalFeatures.CDS.value])
 
     def __str__(self):
         return f"----> {self._seq_feature.__repr__()}"
 
 
+# Maps every feature type that can be part of a gene to the class that wraps it, so that each feature
+# can be classified with a single lookup
+GENE_FEATURE_TYPE_TO_CLASS: Dict[str, Type[Feature]] = {
+    feature_type: feature_class
+    for feature_class in (GeneFeature, TranscriptFeature, CDSFeature)
+    for feature_type in feature_class.types
+}
+
+
 @dataclass
 class GroupedGeneFeatures:
     """
@@ -563,9 +572,10 @@ class BaseGenBankParser(ABC):
     @staticmethod
     def _construct_gene_from_feature(feature: SeqFeature, seqrecord: SeqRecord) -> Optional[GeneFeature]:
         """Convenience function for deciding which function to use when converting a feature to a gene"""
-        if feature.type in GeneFeature.types:
+        feature_class = GENE_FEATURE_TYPE_TO_CLASS.get(feature.type)
+        if feature_class is GeneFeature:
             return GeneFeature(feature, seqrecord)
-        elif feature.type in TranscriptFeature.types or feature.type in CDSFeature.types:
+        elif feature_class is not None:
             return GeneFeature.from_transcript_or_cds_feature(feature, seqrecord)
         else:
             warnings.warn(
@@ -661,13 +671,14 @@ class BaseGenBankParser(ABC):
         """
         group = []
         for feature in features:
+            feature_class = GENE_FEATURE_TYPE_TO_CLASS.get(feature.type)
             # new gene group
             if not group:
-                if feature.type in GeneFeature.types:
+                if feature_class is GeneFeature:
                     group.append(feature)
                     # base case for starting with a isolated ncRNA or CDS feature; immediately add them
                     # and reset the gene to None
-                elif feature.type in TranscriptFeature.types or feature.type in CDSFeature.types:
+                elif feature_class is not None:
                     group.append(feature)
                     yield group
                     group = []
@@ -679,10 +690,10 @@ class BaseGenBankParser(ABC):
                         )
                     )
             # next gene; reset
-            elif feature.type in GeneFeature.types:
+            elif feature_class is GeneFeature:
                 yield group
                 group = [feature]
-            elif feature.type in TranscriptFeature.types:
+            elif feature_class is TranscriptFeature:
                 # if the current gene is non-empty, and the feature is not a mRNA, then this is a isolated ncRNA
                 # finish this gene and start a new one
                 if group and feature.type != TranscriptFeatures.CODING_TRANSCRIPT:
@@ -693,7 +704,7 @@ class BaseGenBankParser(ABC):
                         group = [feature]
                 else:
                     group.append(feature)
-            elif feature.type in CDSFeature.types:
+            elif feature_class is CDSFeature:
                 # are we about to associate this CDS with a non-coding transcript type? If so, don't do so
                 if any(NonCodingTranscriptFeatures.has_value(x.type) for x in group):
                     yield group
@@ -720,11 +731,12 @@ class BaseGenBankParser(ABC):
             transcript_features = []
             cds_features = []
             for feature in feature_group:
-                if feature.type in GeneFeature.types:
+                feature_class = GENE_FEATURE_TYPE_TO_CLASS.get(feature.type)
+                if feature_class is GeneFeature:
                     gene_features.append(feature)
-                elif feature.type in TranscriptFeature.types:
+                elif feature_class is TranscriptFeature:
                     transcript_features.append(feature)
-                elif feature.type in CDSFeature.types:
+                elif feature_class is CDSFeature:
                     cds_features.append(feature)
                 else:
                     warnings.warn(
@@ -765,7 +777,8 @@ class BaseGenBankParser(ABC):
             transcript_features = []
             cds_features = []
             for feature in gene_features:
-                if feature.type == GeneFeatures.GENE.value:
+                feature_class = GENE_FEATURE_TYPE_TO_CLASS.get(feature.type)
+                if feature_class is GeneFeature:
                     if gene_feature is not None:
                         raise GenBankLocusTagError(
                             f"Grouping by locus tag found multiple gene features on the same sequence "
@@ -774,9 +787,9 @@ class BaseGenBankParser(ABC):
                         )
                     else:
                         gene_feature = feature
-                elif feature.type in TranscriptFeature.types:
+                elif feature_class is TranscriptFeature:
                     transcript_features.append(feature)
-                elif feature.type in CDSFeature.types:
+                elif feature_class is CDSFeature:
                     cds_features.append(feature)
                 else:
                     warnings.warn(
@@ -17,8 +17,6 @@ ENCODING_MAP_WITH_COMMA = {
     " ": "%20",
     "%": "%25",
 }
-ENCODING_PATTERN = r"({})".format("|".join(k for k in ENCODING_MAP))
-ENCODING_PATTERN_WITH_COMMA = r"({})".format("|".join(k for k in ENCODING_MAP_WITH_COMMA))
 GFF_SOURCE = "BioCantor"
 NULL_COLUMN = "."
 ATTRIBUTE_SEPARATOR = ","
@@ -54,10 +52,20 @@ class BioCantorGFF3ReservedQualifiers(HasMemberMixin):
     ID = "ID"
 
 
-GFF3ReservedQualifiers = HasMemberMixin(
-    "GenBankFeatures",
-    [[i.name, i.value] for j in [BioCantorGFF3ReservedQualifiers, _GFF3ReservedQualifiers] for i in j],
-)
+class GFF3ReservedQualifiers(HasMemberMixin):
+    """All GFF3 reserved qualifiers; the union of :class:`BioCantorGFF3ReservedQualifiers`
+    and :class:`_GFF3ReservedQualifiers`."""
+
+    NAME = "Name"
+    PARENT = "Parent"
+    ID = "ID"
+    ALIAS = "Alias"
+    TARGET = "Target"
+    DBXREF = "Dbxref"
+    GAP = "Gap"
+    DERIVES_FROM = "Derives_from"
+    NOTE = "Note"
+    ONTOLOGY_TERM = "Ontology_term"
 
 
 class BioCantorQualifiers(Enum):
@@ -90,12 +98,11 @@ class BioCantorQualifiers(Enum):
 BIOCANTOR_QUALIFIERS_REGEX = re.compile(
     r"({})".format(
         "|".join(
-            set.union(
-                *[
-                    {k.name.lower(), k.value}
-                    for k in itertools.chain(BioCantorQualifiers, BioCantorGFF3ReservedQualifiers)
-                ]
-            )
+            {
+                key
+                for k in itertools.chain(BioCantorQualifiers, BioCantorGFF3ReservedQualifiers)
+                for key in (k.name.lower(), k.value)
+            }
         )
     )
 )
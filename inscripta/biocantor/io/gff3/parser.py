@@ -13,10 +13,8 @@ dataclass to adjust the arguments passed to :mod:`gffutils`.
 import logging
 from dataclasses import dataclass
 from collections import Counter
-from io import StringIO
 from pathlib import Path
 from typing import Iterable, List, Optional, Callable, TextIO, Dict, Set, Any
-import re
 import gffutils
 from Bio import SeqIO
 from Bio.SeqRecord import SeqRecord
@@ -57,9 +55,7 @@ class GffutilsParseArgs:
 def filter_and_sort_qualifiers(qualifiers: Dict[str, List[str]]) -> Optional[Dict[str, List[str]]]:
     """Filter out the qualifiers for any terms we have extracted as BioCantor identifiers as well as any
     GFF3 special terms"""
-    qualifiers = {
-        key: sorted(vals) for key, vals in qualifiers.items() if not re.match(BIOCANTOR_QUALIFIERS_REGEX, key)
-    }
+    qualifiers = {key: sorted(vals) for key, vals in qualifiers.items() if not BIOCANTOR_QUALIFIERS_REGEX.match(key)}
     return qualifiers if qualifiers else None
 
 
@@ -460,11 +456,8 @@ def _find_non_gene_feature_types(db: FeatureDB, feature_types_to_ignore: Optiona
             continue
         elif feature_types_to_ignore and feat_type in feature_types_to_ignore:
             continue
-        else:
-            try:
-                _ = Biotype[feat_type]
-            except KeyError:
-                non_gene_feature_types.append(feat_type)
+        elif not Biotype.has_name(feat_type):
+            non_gene_feature_types.append(feat_type)
     return non_gene_feature_types
 
 
@@ -530,8 +523,8 @@ def extract_seqrecords_from_gff3_fasta(gff3_with_fasta_handle: TextIO) -> List[S
     if fasta_found is False:
         raise GFF3FastaException("Did not find FASTA header in the GFF3 file.")
 
-    data = StringIO(gff3_with_fasta_handle.read())
-    recs = list(SeqIO.parse(data, format="fasta"))
+    # parse the remainder of the handle in place instead of copying the FASTA into memory first
+    recs = list(SeqIO.parse(gff3_with_fasta_handle, format="fasta"))
     return recs
 
 
@@ -696,9 +689,8 @@ def parse_gff3_fasta(
     seen_seqs = set()
 
     for annot_record in parse_standard_gff3(gff3, gffutil_parse_args, parse_func, gffutil_transform_func, db_fn):
-        try:
-            seqrecord = seqrecords_dict[annot_record.annotation.sequence_name]
-        except KeyError:
+        seqrecord = seqrecords_dict.get(annot_record.annotation.sequence_name)
+        if seqrecord is None:
             logger.warning(
                 f"Sequence symbol {annot_record.annotation.sequence_name} found in GFF3 but not in FASTA. "
                 f"These annotation records will be ignored."
@@ -1,16 +1,13 @@
 """
 Contains information on how to manage GFF row data. Enforces GFF3 specification rules.
 """
-import re
 from warnings import warn
-from typing import Union, Optional, Any, Hashable, Set, Dict
+from typing import Union, Optional, Any, Hashable, Set, FrozenSet, Dict
 from dataclasses import dataclass
 
 from inscripta.biocantor.io.gff3.constants import (
     ENCODING_MAP,
-    ENCODING_PATTERN,
     ENCODING_MAP_WITH_COMMA,
-    ENCODING_PATTERN_WITH_COMMA,
     ATTRIBUTE_SEPARATOR,
     BioCantorGFF3ReservedQualifiers,
     GFF3ReservedQualifiers,
@@ -20,6 +17,11 @@ from inscripta.biocantor.location import Strand
 from inscripta.biocantor.gene.cds_frame import CDSPhase
 from inscripta.biocantor.io.gff3.exc import GFF3ExportException, ReservedKeyWarning
 
+# every encoded character is a single character, so escaping can be done with str.translate()
+ENCODING_TABLE = str.maketrans(ENCODING_MAP)
+ENCODING_TABLE_WITH_COMMA = str.maketrans(ENCODING_MAP_WITH_COMMA)
+GFF_ROW_TEMPLATE = "{}\t{}\t{}\t{}\t{}\t{}\t{}\t{}\t{}"
+
 
 class GFFAttributes:
     """
@@ -77,10 +79,12 @@ class GFFAttributes:
     using one or more unreserved (lowercase) tags.
     """
 
+    __slots__ = ["id", "name", "parent", "attributes", "raise_on_reserved_attributes"]
+
     def __init__(
         self,
         id: str,
-        qualifiers: Dict[Hashable, Set[Hashable]],
+        qualifiers: Dict[Hashable, Union[Set[Hashable], FrozenSet[Hashable]]],
         *,
         name: Optional[str] = None,
         parent: Optional[str] = None,
@@ -93,7 +97,7 @@ class GFFAttributes:
         self.raise_on_reserved_attributes = raise_on_reserved_attributes
 
         for val in self.attributes.values():
-            if not isinstance(val, set):
+            if not isinstance(val, (set, frozenset)):
                 raise GFF3ExportException("Attributes dictionary must be a dictionary of sets.")
 
     def __str__(self):
@@ -150,11 +154,11 @@ class GFFAttributes:
 
     @staticmethod
     def _escape_str(item: str) -> str:
-        return re.sub(ENCODING_PATTERN, lambda m: ENCODING_MAP.get(m.group(0)), item)
+        return item.translate(ENCODING_TABLE)
 
     @staticmethod
     def _escape_str_with_comma(item: str) -> str:
-        return re.sub(ENCODING_PATTERN_WITH_COMMA, lambda m: ENCODING_MAP_WITH_COMMA.get(m.group(0)), item)
+        return item.translate(ENCODING_TABLE_WITH_COMMA)
 
     @staticmethod
     def escape_key(key: str, lower: Optional[bool] = False) -> str:
@@ -235,6 +239,8 @@ class GFFRow:
     See :class:`GFFAttributes` for further information on the ``attributes`` column.
     """
 
+    __slots__ = ["seqid", "source", "type", "start", "end", "score", "strand", "phase", "attributes"]
+
     seqid: str
     source: str
     type: BioCantorFeatureTypes
@@ -246,19 +252,14 @@ class GFFRow:
     attributes: GFFAttributes
 
     def __str__(self) -> str:
-        return "\t".join(
-            (
-                str(x)
-                for x in [
-                    self.seqid,
-                    self.source,
-                    self.type.value,
-                    self.start,
-                    self.end,
-                    self.score,
-                    self.strand.to_symbol(),
-                    self.phase.to_gff(),
-                    str(self.attributes),
-                ]
-            )
+        return GFF_ROW_TEMPLATE.format(
+            self.seqid,
+            self.source,
+            self.type.value,
+            self.start,
+            self.end,
+            self.score,
+            self.strand.to_symbol(),
+            self.phase.to_gff(),
+            self.attributes,
         )
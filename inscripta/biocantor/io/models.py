@@ -2,6 +2,7 @@
 Data models. These models allow for validation of inputs to a BioCantor model, acting as a JSON schema for serializing
 and deserializing the models.
 """
+from functools import lru_cache
 from typing import List, Optional, ClassVar, Type, Dict, Union
 from dataclasses import field
 from uuid import UUID
@@ -31,6 +32,12 @@ class BaseModel:
     class Meta:
         ordered = True
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _schema(cls) -> Schema:
+        """Cached schema instance for this model, re-used when converting interval objects back to models."""
+        return cls.Schema()
+
 
 @dataclass
 class ParentModel(BaseModel):
@@ -122,7 +129,7 @@ class FeatureIntervalModel(BaseModel):
     @staticmethod
     def from_feature_interval(feature_interval: FeatureInterval) -> "FeatureIntervalModel":
         """Convert a :class:`~biocantor.gene.feature.FeatureInterval` to a :class:`FeatureIntervalModel`"""
-        return FeatureIntervalModel.Schema().load(feature_interval.to_dict())
+        return FeatureIntervalModel._schema().load(feature_interval.to_dict())
 
 
 @dataclass
@@ -183,7 +190,7 @@ class TranscriptIntervalModel(BaseModel):
     def from_transcript_interval(transcript_interval: TranscriptInterval) -> "TranscriptIntervalModel":
         """Convert to a :class:`~biocantor.io.models.TranscriptIntervalModel`"""
 
-        return TranscriptIntervalModel.Schema().load(transcript_interval.to_dict())
+        return TranscriptIntervalModel._schema().load(transcript_interval.to_dict())
 
 
 @dataclass
@@ -207,7 +214,7 @@ class VariantIntervalModel(BaseModel):
     def from_variant_interval(variant_interval: VariantInterval) -> "VariantIntervalModel":
         """Convert to a :class:`~biocantor.io.models.VariantIntervalModel`"""
 
-        return VariantIntervalModel.Schema().load(variant_interval.to_dict())
+        return VariantIntervalModel._schema().load(variant_interval.to_dict())
 
     def to_variant_interval(self, parent_or_seq_chunk_parent: Optional[Parent] = None) -> VariantInterval:
         return VariantInterval(
@@ -268,7 +275,7 @@ class GeneIntervalModel(BaseModel):
 
     @staticmethod
     def from_gene_interval(gene: GeneInterval) -> "GeneIntervalModel":
-        return GeneIntervalModel.Schema().load(gene.to_dict())
+        return GeneIntervalModel._schema().load(gene.to_dict())
 
 
 @dataclass
@@ -311,7 +318,7 @@ class FeatureIntervalCollectionModel(BaseModel):
 
     @staticmethod
     def from_feature_collection(feature_collection: FeatureIntervalCollection) -> "FeatureIntervalCollectionModel":
-        return FeatureIntervalCollectionModel.Schema().load(feature_collection.to_dict())
+        return FeatureIntervalCollectionModel._schema().load(feature_collection.to_dict())
 
 
 @dataclass
@@ -338,7 +345,7 @@ class VariantIntervalCollectionModel(BaseModel):
     ) -> "VariantIntervalCollectionModel":
         """Convert to a :class:`~biocantor.io.models.VariantIntervalModel`"""
 
-        return VariantIntervalCollectionModel.Schema().load(variant_collection.to_dict())
+        return VariantIntervalCollectionModel._schema().load(variant_collection.to_dict())
 
     def to_variant_interval_collection(
         self, parent_or_seq_chunk_parent: Optional[Parent] = None
@@ -440,7 +447,7 @@ class AnnotationCollectionModel(BaseModel):
     ) -> "AnnotationCollectionModel":
         """Convert back to :class:`~AnnotationCollectionModel`."""
 
-        return AnnotationCollectionModel.Schema().load(
+        return AnnotationCollectionModel._schema().load(
             annotation_collection.to_dict(
                 chromosome_relative_coordinates=chromosome_relative_coordinates, export_parent=export_parent
             )
@@ -32,6 +32,8 @@ else:
 class SingleInterval(Location):
     """A single contiguous interval within a sequence"""
 
+    __slots__ = []
+
     def __init__(
         self,
         start: int,
@@ -589,11 +591,9 @@ class CompoundInterval(Location):
     def parent_to_relative_pos(self, parent_pos: int) -> int:
         rel_pos = 0
         for block in self.scan_blocks():
-            try:
-                rel_pos += block.parent_to_relative_pos(parent_pos)
-                return rel_pos
-            except InvalidPositionException:
-                rel_pos += len(block)
+            if block.start <= parent_pos < block.end:
+                return rel_pos + block.parent_to_relative_pos(parent_pos)
+            rel_pos += len(block)
         raise InvalidPositionException(
             f"Requested parent position ({parent_pos}) lies outside this location ({str(self)})"
         )
@@ -130,3 +130,9 @@ ALPHABET_TO_NUCLEOTIDE_COMPLEMENT = {
         "-": "-",
     },
 }
+
+# str.translate() tables for each of the complement maps above, along with the set of characters each one covers
+ALPHABET_TO_NUCLEOTIDE_COMPLEMENT_TABLE = {
+    alphabet: (str.maketrans(complement), frozenset(complement))
+    for alphabet, complement in ALPHABET_TO_NUCLEOTIDE_COMPLEMENT.items()
+}
@@ -12,7 +12,7 @@ from inscripta.biocantor.location.strand import Strand
 from inscripta.biocantor.parent import Parent, make_parent, SequenceType
 from inscripta.biocantor.sequence.alphabet import (
     Alphabet,
-    ALPHABET_TO_NUCLEOTIDE_COMPLEMENT,
+    ALPHABET_TO_NUCLEOTIDE_COMPLEMENT_TABLE,
 )
 from inscripta.biocantor import AbstractSequence
 
@@ -179,11 +179,12 @@ class Sequence(AbstractSequence):
             raise AlphabetError("Cannot reverse complement sequence with alphabet {}".format(self.alphabet))
         location = self.location_on_parent.reverse_strand() if self.location_on_parent else None
         strand = self.parent_strand.reverse() if self.parent_strand else None
-        rc_map = ALPHABET_TO_NUCLEOTIDE_COMPLEMENT[self.alphabet]
-        try:
-            seq_data = "".join((rc_map[c] for c in reversed(str(self))))
-        except KeyError as e:
-            raise AlphabetError("Character {} not found for alphabet {}".format(str(e), self.alphabet))
+        rc_table, rc_chars = ALPHABET_TO_NUCLEOTIDE_COMPLEMENT_TABLE[self.alphabet]
+        reversed_data = str(self)[::-1]
+        if not rc_chars.issuperset(reversed_data):
+            missing = next(c for c in reversed_data if c not in rc_chars)
+            raise AlphabetError("Character {} not found for alphabet {}".format(repr(missing), self.alphabet))
+        seq_data = reversed_data.translate(rc_table)
         rc_parent = Parent(strand=strand, location=location) if strand or location else None
         return Sequence(
             seq_data,
@@ -5,7 +5,10 @@ from enum import Enum
 
 
 class HasMemberMixin(Enum):
-    """Adds a `has_value()` and `has_name()` convenience method to enumerations."""
+    """Adds a `has_value()` and `has_name()` convenience method to enumerations.
+
+    Both are hash lookups against the mappings ``Enum`` maintains, rather than a scan over the members.
+    """
 
     @classmethod
     def has_value(cls, value):
@@ -39,7 +39,7 @@ def _order_dict_of_possible_sets(dict_of_possible_sets: Dict[Hashable, Any]) ->
         yield str(key)
         if isinstance(val, dict):
             yield from _order_dict_of_possible_sets(val)
-        elif isinstance(val, set):
+        elif isinstance(val, (set, frozenset)):
             yield str(_order_set(val))
         else:
             yield str(dict_of_possible_sets[key])
@@ -53,7 +53,7 @@ def _encode_object_for_digest(*args, **kwargs) -> Iterable[str]:
         for member in args:
             if isinstance(member, dict):
                 yield from _order_dict_of_possible_sets(member)
-            elif isinstance(member, set):
+            elif isinstance(member, (set, frozenset)):
                 yield str(_order_set(member))
             else:
                 yield str(member)
@@ -72,7 +72,6 @@ def digest_object(*args, **kwargs) -> UUID:
     Kwargs can be any set of objects with stable string representations, including nested dicts of sets. The argument
     name in the kwargs dictionary are part of the hash produced.
     """
-    hasher = hashlib.md5()
-    for val in _encode_object_for_digest(*args, **kwargs):
-        hasher.update(val.encode("utf-8"))
-    return UUID(hasher.hexdigest())
+    # digesting the concatenated string is equivalent to updating the hasher with each piece in turn
+    encoded = "".join(_encode_object_for_digest(*args, **kwargs)).encode("utf-8")
+    return UUID(bytes=hashlib.md5(encoded).digest())
@@ -0,0 +1,77 @@
+"""
+Pure python implementation of a static, implicit interval index. This is used to accelerate position queries
+when the optional dependency `cgranges` is not installed.
+
+The strategy is borrowed from the implicit interval tree described in cgranges:
+
+https://github.com/lh3/cgranges
+
+Intervals are sorted by start position, and for each position in the sorted order the maximum end position
+seen so far is recorded. A query ``[start, end)`` first uses a binary search to find every interval that starts
+before ``end``, then walks backwards through those intervals until the running maximum end position shows
+that no earlier interval can reach ``start``.
+
+A single very long interval (such as a feature spanning an entire chromosome) raises the running maximum end
+position for every interval after it, which turns every query into a scan of the whole index. To avoid this,
+intervals longer than ``long_interval_size`` are kept out of the sorted index and are checked directly on every
+query.
+
+All intervals are assumed to be half-open and 0-based.
+"""
+from bisect import bisect_left
+from typing import List
+
+# intervals longer than this are not placed in the sorted index
+LONG_INTERVAL_SIZE = 1000000
+
+
+class IntervalIndex:
+    """
+    Static index over a set of intervals. Intervals are referenced by their position in the input lists,
+    and the index cannot be modified after construction.
+    """
+
+    __slots__ = ["_order", "_starts", "_ends", "_max_ends", "_long_intervals"]
+
+    def __init__(self, starts: List[int], ends: List[int], long_interval_size: int = LONG_INTERVAL_SIZE):
+        if len(starts) != len(ends):
+            raise ValueError("Number of starts must match number of ends")
+        self._long_intervals = [
+            (i, start, end) for i, (start, end) in enumerate(zip(starts, ends)) if end - start > long_interval_size
+        ]
+        long_indices = {i for i, _, _ in self._long_intervals}
+        self._order = sorted((i for i in range(len(starts)) if i not in long_indices), key=starts.__getitem__)
+        self._starts = [starts[i] for i in self._order]
+        self._ends = [ends[i] for i in self._order]
+        self._max_ends = []
+        max_end = None
+        for end in self._ends:
+            if max_end is None or end > max_end:
+                max_end = end
+            self._max_ends.append(max_end)
+
+    def __len__(self):
+        return len(self._order) + len(self._long_intervals)
+
+    def overlap(self, start: int, end: int) -> List[int]:
+        """
+        Find all intervals that overlap the half-open query interval ``[start, end)``.
+
+        Args:
+            start: Query start.
+            end: Query end.
+
+        Returns:
+            The positions of the overlapping intervals in the original input lists, in ascending order.
+        """
+        hits = [
+            i
+            for i, interval_start, interval_end in self._long_intervals
+            if interval_start < end and interval_end > start
+        ]
+        i = bisect_left(self._starts, end) - 1
+        while i >= 0 and self._max_ends[i] > start:
+            if self._ends[i] > start:
+                hits.append(self._order[i])
+            i -= 1
+        return sorted(hits)
@@ -2,9 +2,19 @@
 Test GFF3 attribute export.
 """
 import pytest
+from inscripta.biocantor.io.gff3.constants import (
+    BioCantorGFF3ReservedQualifiers,
+    GFF3ReservedQualifiers,
+    _GFF3ReservedQualifiers,
+)
 from inscripta.biocantor.io.gff3.rows import GFFAttributes, GFF3ExportException, ReservedKeyWarning
 
 
+def test_reserved_qualifiers_union():
+    expected = [(i.name, i.value) for j in [BioCantorGFF3ReservedQualifiers, _GFF3ReservedQualifiers] for i in j]
+    assert [(i.name, i.value) for i in GFF3ReservedQualifiers] == expected
+
+
 class TestAttributes:
     @pytest.mark.parametrize(
         "id,qualifiers,name,parent,expected",
@@ -199,6 +199,44 @@ class TestGene:
         )
         assert str(obj.get_merged_cds()) == "FeatureInterval((14-20:+, 22-23:+), name=None)"
 
+    def test_merged_interval_after_reparenting(self):
+        """Merged features cached before a collection re-parents the gene must pick up the new parent"""
+        obj = self.gene.to_gene_interval()
+        _ = obj.get_merged_transcript()
+        _ = obj.get_merged_cds()
+        annot = AnnotationCollection(genes=[obj], parent_or_seq_chunk_parent=parent_genome)
+        gene = annot.genes[0]
+        assert str(gene.get_merged_transcript().get_spliced_sequence()) == "GTATTCTTGGACCTAA"
+        assert str(gene.get_merged_cds().get_spliced_sequence()) == "ATTCTTA"
+
+    def test_export_qualifiers(self):
+        obj = (
+            GeneIntervalModel.Schema()
+            .load(dict(transcripts=[self.tx1], qualifiers={"gene_id": ["other"]}, gene_id="gene1"))
+            .to_gene_interval()
+        )
+        qualifiers = obj.export_qualifiers()
+        assert qualifiers["gene_id"] == {"gene1", "other"}
+        # exporting does not modify the qualifiers of the gene itself
+        assert obj.qualifiers["gene_id"] == {"other"}
+        # callers can modify the exported dictionary without changing later exports
+        del qualifiers["gene_id"]
+        qualifiers["new"] = frozenset(["val"])
+        assert obj.export_qualifiers()["gene_id"] == {"gene1", "other"}
+        assert "new" not in obj.export_qualifiers()
+
+    def test_repr(self):
+        obj = (
+            GeneIntervalModel.Schema()
+            .load(dict(transcripts=[dict(exon_starts=[i], exon_ends=[i + 5], strand="PLUS") for i in range(5)]))
+            .to_gene_interval()
+        )
+        assert repr(obj) == (
+            "GeneInterval(identifiers=set(), Intervals:TranscriptInterval((0-5:+), cds=[None], symbol=None),"
+            "TranscriptInterval((1-6:+), cds=[None], symbol=None),"
+            "TranscriptInterval((2-7:+), cds=[None], symbol=None),...2 more)"
+        )
+
     def test_failed_merge_interval(self):
         obj = self.gene_noncoding.to_gene_interval()
         with pytest.raises(NoncodingTranscriptError):
@@ -328,6 +366,20 @@ class TestFeatureIntervalCollection:
         obj = self.collection1.to_feature_collection()
         assert str(obj.get_merged_feature()) == "FeatureInterval((12-16:+, 17-20:+, 22-25:+), name=featgrp1)"
 
+    def test_export_qualifiers(self):
+        obj = self.collection1.to_feature_collection()
+        qualifiers = obj.export_qualifiers()
+        assert qualifiers["feature_collection_name"] == {"featgrp1"}
+        qualifiers.clear()
+        assert obj.export_qualifiers()["feature_collection_name"] == {"featgrp1"}
+
+    def test_merged_interval_after_reparenting(self):
+        """Merged features cached before a collection re-parents the feature collection must pick up the new parent"""
+        obj = self.collection1.to_feature_collection()
+        _ = obj.get_merged_feature()
+        annot = AnnotationCollection(feature_collections=[obj], parent_or_seq_chunk_parent=parent_genome)
+        assert str(annot.feature_collections[0].get_merged_feature().get_spliced_sequence()) == "GTATCTTACC"
+
     def test_query_by_guid(self):
         # query by all
         obj = self.collection1.to_feature_collection()
@@ -964,6 +1016,21 @@ class TestAnnotationCollection:
         r = obj.query_by_feature_identifiers(["gene1", "abc"])
         assert len(r.genes) == 1 and r.genes[0].gene_id == "gene1"
 
+    @pytest.mark.parametrize(
+        "query,guid",
+        [
+            ("query_by_guids", UUID("94e30bde-d622-3b98-1745-ab022b6ae6ab")),
+            ("query_by_interval_guids", UUID("043d7309-9036-7b27-d841-b7d6a2f70712")),
+            ("query_by_transcript_interval_guids", UUID("043d7309-9036-7b27-d841-b7d6a2f70712")),
+            ("query_by_feature_interval_guids", UUID("079c8c04-e2bd-590b-87f7-cb792ba67064")),
+        ],
+    )
+    def test_query_by_guids_non_uuid(self, query, guid):
+        """IDs that are not UUIDs are skipped as misses"""
+        obj = self.annot.to_annotation_collection()
+        assert getattr(obj, query)([str(guid), None, 1]).is_empty
+        assert len(getattr(obj, query)(["abc", None, guid]).children) == 1
+
     def test_hierarchical_children_guids(self):
         obj = self.annot.to_annotation_collection()
         assert obj.hierarchical_children_guids == {
@@ -2096,3 +2163,110 @@ class TestNegative:
         new_ac = ac.query_by_feature_identifiers("SIK1B")
         assert new_ac.start == 111130
         assert new_ac.end == 123778
+
+
+class TestIndexedPositionQueries:
+    """Position queries on collections large enough to use an index must match the linear scan."""
+
+    genome = "ATGC" * 1000
+    parent = Parent(id="genome", sequence=Sequence(genome, Alphabet.NT_STRICT), sequence_type=SequenceType.CHROMOSOME)
+    annot = AnnotationCollectionModel.Schema().load(
+        dict(
+            genes=[
+                dict(
+                    transcripts=[
+                        dict(
+                            exon_starts=[i * 40, i * 40 + 20],
+                            exon_ends=[i * 40 + 10, i * 40 + 50 + (i % 7) * 30],
+                            cds_starts=[i * 40 + 2] if i % 2 else None,
+                            cds_ends=[i * 40 + 8] if i % 2 else None,
+                            cds_frames=["ZERO"] if i % 2 else [],
+                            strand=Strand.PLUS.name,
+                        )
+                    ],
+                    gene_id=f"gene{i}",
+                )
+                for i in range(80)
+            ],
+            feature_collections=[
+                dict(
+                    feature_intervals=[dict(interval_starts=[i * 50], interval_ends=[i * 50 + 25], strand="PLUS")],
+                    feature_collection_id=f"featgrp{i}",
+                )
+                for i in range(20)
+            ],
+            start=0,
+            end=len(genome),
+        )
+    )
+
+    @pytest.mark.parametrize(
+        "start,end",
+        [(0, 4000), (0, 100), (95, 405), (1000, 1001), (3000, 3500), (1234, 2345)],
+    )
+    @pytest.mark.parametrize("completely_within", [True, False])
+    @pytest.mark.parametrize("coding_only", [True, False])
+    def test_indexed_matches_linear(self, start, end, completely_within, coding_only):
+        obj = self.annot.to_annotation_collection(self.parent)
+        indexed = obj._indexed_query_by_position(start, end, completely_within, coding_only)
+        linear = obj._query_by_position(start, end, completely_within, coding_only)
+        assert indexed == linear
+
+    # genes spread over several UCSC bins at every level, some of which span bin boundaries
+    binned_annot = AnnotationCollectionModel.Schema().load(
+        dict(
+            genes=[
+                dict(
+                    transcripts=[
+                        dict(
+                            exon_starts=[i * 70000],
+                            exon_ends=[i * 70000 + 1000 + (i % 5) * 60000],
+                            strand=Strand.PLUS.name,
+                        )
+                    ],
+                    gene_id=f"gene{i}",
+                )
+                for i in range(30)
+            ],
+        )
+    )
+
+    @pytest.mark.parametrize(
+        "start,end",
+        [(0, 3000000), (0, 131072), (131072, 262144), (100000, 1200000), (650000, 700000), (1000, 1001)],
+    )
+    def test_binned_completely_within_matches_scan(self, start, end):
+        obj = self.binned_annot.to_annotation_collection()
+        genes, _, _ = obj._query_by_position(start, end, completely_within=True, coding_only=False)
+        assert genes == [gene for gene in obj.genes if gene.start >= start and gene.end <= end]
+
+    def test_coding_only_with_variants(self):
+        obj = (
+            AnnotationCollectionModel.Schema()
+            .load(
+                dict(
+                    genes=[
+                        dict(
+                            transcripts=[
+                                dict(
+                                    exon_starts=[0],
+                                    exon_ends=[20],
+                                    cds_starts=[0],
+                                    cds_ends=[9],
+                                    cds_frames=["ZERO"],
+                                    strand=Strand.PLUS.name,
+                                )
+                            ]
+                        )
+                    ],
+                    variant_collections=[
+                        dict(variant_intervals=[dict(start=5, end=6, sequence="A", variant_type="SNV")])
+                    ],
+                )
+            )
+            .to_annotation_collection()
+        )
+        for query in [obj._query_by_position, obj._indexed_query_by_position]:
+            genes, features, variants = query(0, 20, completely_within=False, coding_only=True)
+            assert genes == obj.genes
+            assert features == variants == []
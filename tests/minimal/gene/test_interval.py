@@ -1,6 +1,8 @@
 """
 Test static methods on the base classes in biocantor.gene.interval
 """
+from functools import reduce
+
 import pytest
 
 from inscripta.biocantor.exc import (
@@ -8,7 +10,7 @@ from inscripta.biocantor.exc import (
     NullSequenceException,
     MismatchedParentException,
 )
-from inscripta.biocantor.gene.interval import AbstractInterval
+from inscripta.biocantor.gene.interval import AbstractInterval, AbstractFeatureIntervalCollection
 from inscripta.biocantor.location.location_impl import SingleInterval, Strand
 from inscripta.biocantor.parent.parent import Parent
 from inscripta.biocantor.sequence.sequence import SequenceType, Sequence, Alphabet
@@ -254,3 +256,66 @@ class TestAbstractInterval:
     def test_liftover_location_to_seq_chunk_parent_exceptions(self, location, parent, exception):
         with pytest.raises(exception):
             _ = AbstractInterval.liftover_location_to_seq_chunk_parent(location, parent)
+
+
+class TestAbstractFeatureIntervalCollection:
+    @pytest.mark.parametrize(
+        "blocks,exp",
+        [
+            ([SingleInterval(0, 5, Strand.PLUS)], ([0], [5])),
+            ([SingleInterval(10, 15, Strand.PLUS), SingleInterval(0, 5, Strand.PLUS)], ([0, 10], [5, 15])),
+            # overlapping and contained blocks
+            (
+                [
+                    SingleInterval(0, 5, Strand.PLUS),
+                    SingleInterval(3, 8, Strand.PLUS),
+                    SingleInterval(4, 6, Strand.PLUS),
+                ],
+                ([0], [8]),
+            ),
+            # a pair of adjacent blocks is not combined
+            ([SingleInterval(5, 8, Strand.MINUS), SingleInterval(0, 5, Strand.MINUS)], ([0, 5], [5, 8])),
+            # but adjacent blocks are combined once a third block is merged in
+            (
+                [
+                    SingleInterval(0, 5, Strand.PLUS),
+                    SingleInterval(5, 8, Strand.PLUS),
+                    SingleInterval(20, 25, Strand.PLUS),
+                ],
+                ([0, 20], [8, 25]),
+            ),
+            # overlapping a pair of adjacent blocks
+            (
+                [
+                    SingleInterval(0, 5, Strand.PLUS),
+                    SingleInterval(5, 8, Strand.PLUS),
+                    SingleInterval(3, 4, Strand.PLUS),
+                ],
+                ([0], [8]),
+            ),
+            # collapsing to a single block, followed by an adjacent block
+            (
+                [
+                    SingleInterval(11, 12, Strand.PLUS),
+                    SingleInterval(12, 17, Strand.PLUS),
+                    SingleInterval(2, 2, Strand.PLUS),
+                    SingleInterval(6, 11, Strand.PLUS),
+                ],
+                ([6, 11], [11, 17]),
+            ),
+            # empty blocks are dropped
+            ([SingleInterval(0, 5, Strand.PLUS), SingleInterval(7, 7, Strand.PLUS)], ([0], [5])),
+            ([SingleInterval(7, 7, Strand.PLUS), SingleInterval(0, 5, Strand.PLUS)], ([0], [5])),
+        ],
+    )
+    def test_merge_blocks(self, blocks, exp):
+        assert AbstractFeatureIntervalCollection._merge_blocks(blocks) == exp
+        # same result as the union of all of the blocks
+        merged = reduce(lambda x, y: x.union(y), blocks)
+        assert ([x.start for x in merged.blocks], [x.end for x in merged.blocks]) == exp
+
+    def test_merge_blocks_mixed_strands(self):
+        with pytest.raises(ValueError):
+            _ = AbstractFeatureIntervalCollection._merge_blocks(
+                [SingleInterval(0, 5, Strand.PLUS), SingleInterval(10, 15, Strand.MINUS)]
+            )
@@ -13,6 +13,7 @@ from uuid import UUID
         ({"a", "c", "b"}, ["['a', 'b', 'c']"], UUID("eea45728-5a61-f212-e4bb-aaf890263ab4")),
         ({"a", "b", 1}, ["['1', 'a', 'b']"], UUID("b4fb5de6-eb7f-5fe3-9a86-c9cb8d7e89cf")),
         ({"a", 1, "b"}, ["['1', 'a', 'b']"], UUID("b4fb5de6-eb7f-5fe3-9a86-c9cb8d7e89cf")),
+        (frozenset({"a", "c", "b"}), ["['a', 'b', 'c']"], UUID("eea45728-5a61-f212-e4bb-aaf890263ab4")),
     ],
 )
 def test_sets(val, str_rep, uuid):
@@ -26,6 +27,7 @@ def test_sets(val, str_rep, uuid):
         ({"key1": {"a", "b", "c"}}, ["key1", "['a', 'b', 'c']"], UUID("0586f397-e249-5a02-d9e2-f2c4a27d8e44")),
         ({"key1": {"c", "b", "a"}}, ["key1", "['a', 'b', 'c']"], UUID("0586f397-e249-5a02-d9e2-f2c4a27d8e44")),
         ({"key1": {"a", "b", 1}}, ["key1", "['1', 'a', 'b']"], UUID("099ab1fd-be7f-ba53-1a9d-d35a76995d0e")),
+        ({"key1": frozenset({"a", "b", 1})}, ["key1", "['1', 'a', 'b']"], UUID("099ab1fd-be7f-ba53-1a9d-d35a76995d0e")),
     ],
 )
 def test_dicts_of_sets(val, str_rep, uuid):
@@ -0,0 +1,65 @@
+"""
+Test the pure python interval index against a brute force overlap search.
+"""
+import random
+
+import pytest
+
+from inscripta.biocantor.util.interval_index import IntervalIndex
+
+
+def brute_force_overlap(starts, ends, start, end):
+    return [i for i, (s, e) in enumerate(zip(starts, ends)) if s < end and e > start]
+
+
+@pytest.mark.parametrize(
+    "starts,ends,start,end,expected",
+    [
+        ([], [], 0, 10, []),
+        ([0], [10], 0, 10, [0]),
+        ([0], [10], 10, 20, []),
+        ([10], [20], 0, 10, []),
+        ([0, 5, 12], [10, 8, 15], 6, 7, [0, 1]),
+        ([0, 5, 12], [10, 8, 15], 9, 13, [0, 2]),
+        # a long interval early in the sort order must still be found
+        ([0, 5, 12], [100, 8, 15], 50, 60, [0]),
+        # input order is not required to be sorted
+        ([12, 0, 5], [15, 10, 8], 6, 13, [0, 1, 2]),
+    ],
+)
+def test_overlap(starts, ends, start, end, expected):
+    index = IntervalIndex(starts, ends)
+    assert len(index) == len(starts)
+    assert index.overlap(start, end) == expected
+
+
+def test_overlap_random():
+    rng = random.Random(0)
+    starts = [rng.randint(0, 10000) for _ in range(500)]
+    ends = [s + rng.randint(1, 500) for s in starts]
+    index = IntervalIndex(starts, ends)
+    for _ in range(200):
+        start = rng.randint(0, 10500)
+        end = start + rng.randint(1, 1000)
+        assert index.overlap(start, end) == brute_force_overlap(starts, ends, start, end)
+
+
+@pytest.mark.parametrize("long_interval_size", [0, 100, 1000])
+def test_overlap_random_long_intervals(long_interval_size):
+    rng = random.Random(0)
+    starts = [rng.randint(0, 10000) for _ in range(500)]
+    ends = [s + rng.randint(1, 500) for s in starts]
+    # intervals spanning most of the range
+    starts.extend([0, 50, 3000])
+    ends.extend([10500, 9000, 8000])
+    index = IntervalIndex(starts, ends, long_interval_size=long_interval_size)
+    assert len(index) == len(starts)
+    for _ in range(200):
+        start = rng.randint(0, 10500)
+        end = start + rng.randint(1, 1000)
+        assert index.overlap(start, end) == brute_force_overlap(starts, ends, start, end)
+
+
+def test_mismatched_lengths():
+    with pytest.raises(ValueError):
+        _ = IntervalIndex([0, 1], [5])